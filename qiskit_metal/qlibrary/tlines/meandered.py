@@ -12,10 +12,9 @@
 # copyright notice, and modified files need to carry a notice indicating
 # that they have been altered from the originals.
 
+import math
 from typing import List, Tuple, Union
 
-from numpy.linalg import norm
-
 import numpy as np
 from qiskit_metal import Dict
 from qiskit_metal.toolbox_metal.parsing import is_true
@@ -23,6 +22,263 @@ from qiskit_metal.qlibrary.core import QRoute, QRoutePoint
 from qiskit_metal.toolbox_metal import math_and_overrides as mao
 from qiskit_metal.toolbox_metal.exceptions import QiskitMetalDesignError
 
+# Values closer to zero than this are float noise, and treated as zero
+_ZERO_TOLERANCE = 1e-9
+
+
+def _dot2(vector_1: np.ndarray, vector_2: np.ndarray) -> float:
+    """Same as `mao.dot`, specialized for 2D vectors to skip numpy dispatch.
+
+    Args:
+        vector_1 (np.ndarray): First of the dot product vectors
+        vector_2 (np.ndarray): Second of the dot product vectors
+
+    Returns:
+        float: Rounded dot product
+    """
+    return round(float(vector_1[0] * vector_2[0] + vector_1[1] * vector_2[1]),
+                 mao.DECIMAL_PRECISION)
+
+
+def _cross2(vector_1: np.ndarray, vector_2: np.ndarray) -> float:
+    """Same as `mao.cross`, specialized for 2D vectors to skip numpy dispatch.
+
+    Args:
+        vector_1 (np.ndarray): First of the cross product vectors
+        vector_2 (np.ndarray): Second of the cross product vectors
+
+    Returns:
+        float: Rounded cross product (z component)
+    """
+    return round(float(vector_1[0] * vector_2[1] - vector_1[1] * vector_2[0]),
+                 mao.DECIMAL_PRECISION)
+
+
+def _sign(value: float, tolerance: float = 0.) -> int:
+    """Sign of the value as an int: -1, 0 (within tolerance) or +1."""
+    return (value > tolerance) - (value < -tolerance)
+
+
+def _snap_pair(xy: np.ndarray, axis: int, idx_a: int, idx_b: int,
+               target: float):
+    """Align a pair of points to the target value, along one coordinate.
+
+    Args:
+        xy (np.ndarray): Points, stored as one row per coordinate. Edited in place.
+        axis (int): Coordinate to align (0 for x, 1 for y)
+        idx_a (int): Index of the first point of the pair
+        idx_b (int): Index of the second point of the pair
+        target (float): Value of the coordinate after alignment
+    """
+    xy[axis, idx_a] = target
+    xy[axis, idx_b] = target
+
+
+def _issideways(point: np.ndarray, seg_point_a: np.ndarray,
+                seg_point_b: np.ndarray) -> bool:
+    """Is the point on the sideways (left-hand) side of the segment a->b?"""
+    return _cross2(point - seg_point_a, seg_point_b - seg_point_a) < 0
+
+
+def _index_for_side1_meander(num_root_pts: int) -> Tuple[np.ndarray, int]:
+    """Indices in the meander points array of the first-side curve pairs.
+
+    Args:
+        num_root_pts (int): Number of root points of the meander
+
+    Returns:
+        tuple: Array of indices, and 1 if num_root_pts is odd (0 otherwise)
+    """
+    num_2pts, odd = divmod(num_root_pts, 2)
+
+    # pairs [4k, 4k+1], built as one (num_2pts, 2) block and flattened
+    z = (np.arange(num_2pts)[:, None] * 4 + np.arange(2)).ravel()
+    return z, odd
+
+
+def _connect_meandered_kernel(start_pos: np.ndarray, start_dir: np.ndarray,
+                              end_pos: np.ndarray, end_dir: np.ndarray,
+                              forward: np.ndarray, sideways: np.ndarray,
+                              spacing: float, asymmetry: float,
+                              length_meander: float, snap: bool,
+                              prevent_short_edges: bool,
+                              fillet: float) -> Tuple[np.ndarray, bool]:
+    """Geometry core of `RouteMeander.connect_meandered`.
+
+    Works exclusively on parsed floats and arrays, without access to the
+    component, so that it does not pay for option parsing or method dispatch.
+
+    Args:
+        start_pos (np.ndarray): Position of the start point
+        start_dir (np.ndarray): Direction of the start point
+        end_pos (np.ndarray): Position of the end point
+        end_dir (np.ndarray): Direction of the end point
+        forward (np.ndarray): Unit vector from start towards end
+        sideways (np.ndarray): Unit vector 90deg CCW from forward
+        spacing (float): Minimum spacing between adjacent meander curves
+        asymmetry (float): Offset of the meander center-line
+        length_meander (float): Length to be covered by the meander
+        snap (bool): True to snap to the xy grid
+        prevent_short_edges (bool): True to remove the terminating jogs
+        fillet (float): Corner fillet radius
+
+    Returns:
+        tuple: Array of points (empty if no meander fits), and True if the first
+        meander goes in the sideways direction
+    """
+    # Calculate lengths and meander number
+    dist = end_pos - start_pos
+    if snap:
+        length_direct = abs(_dot2(dist, forward))  # in the vertical direction
+        length_sideways = abs(_dot2(dist,
+                                    sideways))  # in the orthogonal direction
+    else:
+        length_direct = math.hypot(dist[0], dist[1])
+        length_sideways = 0
+
+    # Breakup into sections
+    meander_number = math.floor(length_direct / spacing)
+
+    # Orientation of the roots w.r.t. sideways: +1 along, -1 opposite, 0 neither
+    start_meander_direction = _dot2(start_dir, sideways)
+    end_meander_direction = _dot2(end_dir, sideways)
+    start_sign = _sign(start_meander_direction)
+    end_sign = _sign(end_meander_direction)
+
+    # The start and end points can have 4 directions each. Depending on the direction
+    # there might be not enough space for all the meanders, thus here we adjust
+    # meander_number w.r.t. what the start and end points "directionality" allows:
+    # even meander_number is no good if roots have same orientation (w.r.t sideway),
+    # odd meander_number is no good if roots have opposite orientation (w.r.t sideway)
+    same_orientation = _sign(start_meander_direction * end_meander_direction,
+                             _ZERO_TOLERANCE)
+    parity = meander_number & 1
+    if ((same_orientation > 0 and not parity) or
+        (same_orientation < 0 and parity)):
+        meander_number -= 1
+    if meander_number < 1:
+        return np.empty((0, 2), float), True
+
+    # should the first meander go sideways or counter sideways?
+    # it follows the start root, else it is forced by the end root given the
+    # parity of meander_number, else either direction is fine, so pick sideways
+    parity = meander_number & 1
+    first_meander_sideways = (start_sign > 0 or (start_sign == 0 and
+                                                 (end_sign == 0 or
+                                                  (end_sign > 0) == parity)))
+
+    # length to distribute on the meanders (excess w.r.t a straight line between start and end)
+    length_excess = (length_meander - length_direct - 2 * abs(asymmetry))
+    # how much meander offset from center-line is needed to accommodate the length_excess (perpendicular length)
+    length_perp = max(0, length_excess / (meander_number * 2.))
+
+    # Points are stored as one row per coordinate (x row, y row), so that
+    # the axis-specific alignments below write into a contiguous row
+    # distance of each meander root from the start, along forward
+    scale_bys = spacing * np.arange(meander_number + 1)
+    # multiply each one in a linear chain fashion fwd
+    middle_xy = forward[:, None] * scale_bys[None, :]
+    '''
+    middle_xy = array([
+        [0. , 0.2, 0.4, 0.6, 0.8, 1. ],
+        [0. , 0. , 0. , 0. , 0. , 0. ]])
+    '''
+
+    ################################################################
+    # Calculation
+    # including start and end points - there is no overlap in points
+    # single column vectors, broadcast against all the middle_xy
+    side_shift_vec = (sideways * length_perp)[:, None]
+    asymmetry_vec = (sideways * asymmetry)[:, None]
+    root_xy = middle_xy + asymmetry_vec
+    top_xy = root_xy + side_shift_vec
+    bot_xy = root_xy - side_shift_vec
+
+    ################################################################
+    # Combine points
+    # Meanest part of the meander
+
+    # xy will have to store properly alternated top_xy and bot_xy
+    # it will also store right-most root_xy (end)
+    # 2 points from top_xy and bot_xy will be dropped for a complete meander
+    # every column is written below (side1 indices 4k, 4k+1, side2 indices
+    # 4k+2, 4k+3, and the last root), so there is no need to zero-fill
+    num_root_pts = root_xy.shape[1]
+    xy = np.empty((2, 2 * num_root_pts + 1 - 2))
+    # need to add the last root_xy in, because there could be a left-over non-meandered segment
+    xy[:, -1] = root_xy[:, -1]
+    idx_side1_meander, odd = _index_for_side1_meander(num_root_pts)
+    idx_side2_meander = 2 + idx_side1_meander[:None if odd else -2]
+    # side1 holds the first meander curve, side2 the opposite one
+    if first_meander_sideways:
+        side1_xy, side2_xy = top_xy, bot_xy
+    else:
+        side1_xy, side2_xy = bot_xy, top_xy
+    xy[:, idx_side1_meander] = side1_xy[:, :-1 if odd else None]
+    xy[:, idx_side2_meander] = side2_xy[:, 1:None if odd else -1]
+
+    xy += start_pos[:, None]  # move to start position
+
+    # coordinate index of the sideways axis (across the meander) and of the
+    # forward axis (along the meander), for axis-specific alignments
+    side_axis = 1 if abs(forward[0]) >= 0.5 else 0
+    fwd_axis = 1 - side_axis
+
+    # are the pins pointing opposite directions and diverging?
+    diverging = (_dot2(start_dir, end_dir) < 0 and
+                 _dot2(forward, start_dir) <= 0)
+
+    if snap:
+        if diverging:
+            # pins are pointing opposite directions and diverging
+            # the last root_pts need to be sideways aligned with the end.position point
+            # and forward aligned with the previous meander point
+            xy[side_axis, -1] = xy[side_axis, -2]
+            xy[fwd_axis, -1] = end_pos[fwd_axis]
+        else:
+            # the last root_pts need to be forward aligned with the end.position point
+            xy[side_axis, -1] = end_pos[side_axis]
+            # and if the last root_pts ends outside the CPW amplitude on the side where the last meander is
+            # then the last meander needs to be locked on it as well
+            last_sideways = _issideways(xy[:, -1], xy[:, -3], xy[:, -2])
+            first_root = root_xy[:, 0] + start_pos
+            last_root = root_xy[:, -1] + start_pos
+            amplitude_sideways = _issideways(xy[:, -2], first_root, last_root)
+            if last_sideways == amplitude_sideways:
+                _snap_pair(xy, side_axis, -2, -3, end_pos[side_axis])
+    if abs(asymmetry) > abs(length_perp):
+        if not diverging:
+            # pins are "not" pointing opposite directions and diverging
+            if start_meander_direction * asymmetry < 0:  # sideway direction
+                _snap_pair(xy, side_axis, 0, 1, start_pos[side_axis])
+            if end_meander_direction * asymmetry < 0:  # opposite sideway direction
+                _snap_pair(xy, side_axis, -2, -3, end_pos[side_axis])
+
+    # Adjust the meander to eliminate the terminating jog (dogleg)
+    if prevent_short_edges:
+        x2fillet = 2 * fillet
+        # adjust the tail first
+        # the meander algorithm adds a final point in line with the tail, to cope with left-over
+        # this extra point needs to be moved or not, depending on the tail tip direction
+        if end_meander_direction != 0:
+            skippoint = 0
+        else:
+            skippoint = 1
+        for axis in (0, 1):
+            gap = abs(end_pos[axis] - xy[axis, -1])
+            if _ZERO_TOLERANCE < gap < x2fillet - _ZERO_TOLERANCE:
+                _snap_pair(xy, axis - skippoint, -1 - skippoint, -2 - skippoint,
+                           end_pos[axis - skippoint])
+        # repeat for the start. here we do not have the extra point
+        for axis in (0, 1):
+            gap = abs(start_pos[axis] - xy[axis, 0])
+            if _ZERO_TOLERANCE < gap < x2fillet - _ZERO_TOLERANCE:
+                _snap_pair(xy, axis, 0, 1, start_pos[axis])
+
+    # back to one row per point
+    pts = xy.T.copy()
+    return pts, first_meander_sideways
+
 
 class RouteMeander(QRoute):
     """Implements a simple CPW, with a single meander.  The base `CPW
@@ -75,7 +331,7 @@ class RouteMeander(QRoute):
         qcomponent.add_qgeometry(...), adding in extra needed information, such
         as layer, subtract, etc."""
         # parsed options
-        snap = is_true(self.p.snap)
+        total_length = self.p.total_length
 
         # Set the CPW pins and add the points/directions to the lead-in/out arrays
         self.set_pin("start")
@@ -86,16 +342,27 @@ class RouteMeander(QRoute):
         meander_end_point = self.set_lead("end")
 
         # approximate length needed for the meander
-        self._length_segment = self.p.total_length - (self.head.length +
-                                                      self.tail.length)
+        self._length_segment = total_length - (self.head.length +
+                                               self.tail.length)
 
-        arc_pts = self.connect_meandered(meander_start_point, meander_end_point)
+        arc_pts, forward, sideways, first_meander_sideways = \
+            self._connect_meandered(meander_start_point, meander_end_point)
 
         self.intermediate_pts = arc_pts
 
+        if len(arc_pts) == 0:
+            # no meander fits, thus there is no length to redistribute
+            self.make_elements(self.get_points())
+            return
+
         self.intermediate_pts = self.adjust_length(
-            self.p.total_length - self.length, arc_pts, meander_start_point,
-            meander_end_point)
+            total_length - self.length,
+            arc_pts,
+            meander_start_point,
+            meander_end_point,
+            forward=forward,
+            sideways=sideways,
+            first_meander_sideways=first_meander_sideways)
 
         # Make points into elements
         self.make_elements(self.get_points())
@@ -115,16 +382,33 @@ class RouteMeander(QRoute):
             * Includes the start but not the given end point
             * If it cannot meander just returns the initial start point
         """
+        return self._connect_meandered(start_pt, end_pt)[0]
+
+    def _connect_meandered(
+            self, start_pt: QRoutePoint, end_pt: QRoutePoint
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, bool]:
+        """Same as `connect_meandered`, but also returns the meander coordinate
+        system, so that `adjust_length` does not need to recompute it.
+
+        Args:
+            start_pt (QRoutePoint): QRoutePoint of the start
+            end_pt (QRoutePoint): QRoutePoint of the end
+
+        Returns:
+            tuple: Array of points, forward and sideways unit vectors, and
+            True if the first meander goes in the sideways direction
+        """
 
         ################################################################
         # Setup
 
-        # Parameters
+        # Parameters (parse each option only once)
         meander_opt = self.p.meander
         spacing = meander_opt.spacing  # Horizontal spacing between meanders
         asymmetry = meander_opt.asymmetry
         snap = is_true(self.p.snap)  # snap to xy grid
         prevent_short_edges = is_true(self.p.prevent_short_edges)
+        fillet = self.p.fillet
 
         # take care of anchors (do not have set directions)
         anchor_lead = 0
@@ -135,183 +419,26 @@ class RouteMeander(QRoute):
 
         # Meander length
         length_meander = self._length_segment
-        if self.p.snap:
-            # handle y distance
-            length_meander -= 0  # (end.position - endm.position)[1]
 
         # Coordinate system (example: x to the right => sideways up)
         forward, sideways = self.get_unit_vectors(start_pt, end_pt, snap)
 
-        # Calculate lengths and meander number
-        dist = end_pt.position - start_pt.position
-        if snap:
-            length_direct = abs(norm(mao.dot(
-                dist, forward)))  # in the vertical direction
-            length_sideways = abs(norm(mao.dot(
-                dist, sideways)))  # in the orthogonal direction
-        else:
-            length_direct = norm(dist)
-            length_sideways = 0
-
-        # Breakup into sections
-        meander_number = np.floor(length_direct / spacing)
-        if meander_number < 1:
+        pts, first_meander_sideways = _connect_meandered_kernel(
+            start_pt.position, start_pt.direction, end_pt.position,
+            end_pt.direction, forward, sideways, spacing, asymmetry,
+            length_meander, snap, prevent_short_edges, fillet)
+        if len(pts) == 0:
             self.logger.info(f'Zero meanders for {self.name}')
-            return np.empty((0, 2), float)
-
-        # The start and end points can have 4 directions each. Depending on the direction
-        # there might be not enough space for all the meanders, thus here we adjust
-        # meander_number w.r.t. what the start and end points "directionality" allows
-        if mao.round(
-                mao.dot(start_pt.direction, sideways) *
-                mao.dot(end_pt.direction, sideways)) > 0 and (meander_number %
-                                                              2) == 0:
-            # even meander_number is no good if roots have same orientation (w.r.t sideway)
-            meander_number -= 1
-        elif mao.round(
-                mao.dot(start_pt.direction, sideways) *
-                mao.dot(end_pt.direction, sideways)) < 0 and (meander_number %
-                                                              2) == 1:
-            # odd meander_number is no good if roots have opposite orientation (w.r.t sideway)
-            meander_number -= 1
-
-        # should the first meander go sideways or counter sideways?
-        start_meander_direction = mao.dot(start_pt.direction, sideways)
-        end_meander_direction = mao.dot(end_pt.direction, sideways)
-        if start_meander_direction > 0:  # sideway direction
-            first_meander_sideways = True
-        elif start_meander_direction < 0:  # opposite to sideway direction
-            first_meander_sideways = False
-        else:
-            if end_meander_direction > 0:  # sideway direction
-                first_meander_sideways = ((meander_number % 2) == 1)
-            elif end_meander_direction < 0:  # opposite to sideway direction
-                first_meander_sideways = ((meander_number % 2) == 0)
-            else:
-                # either direction is fine, so let's just pick one
-                first_meander_sideways = True
-
-        # length to distribute on the meanders (excess w.r.t a straight line between start and end)
-        length_excess = (length_meander - length_direct - 2 * abs(asymmetry))
-        # how much meander offset from center-line is needed to accommodate the length_excess (perpendicular length)
-        length_perp = max(0, length_excess / (meander_number * 2.))
-
-        # USES ROW Vectors
-        # const vec. of unit normals
-        middle_points = [forward] * int(meander_number + 1)
-        # index so to multiply other column - creates a column vector
-        scale_bys = spacing * np.arange(int(meander_number + 1))[:, None]
-        # multiply each one in a linear chain fashion fwd
-        middle_points = scale_bys * middle_points
-        '''
-        middle_points = array([
-            [0. , 0. ],
-            [0.2, 0. ],
-            [0.4, 0. ],
-            [0.6, 0. ],
-            [0.8, 0. ],
-            [1. , 0. ]])
-        '''
-
-        ################################################################
-        # Calculation
-        # including start and end points - there is no overlap in points
-        # root_pts = np.concatenate([middle_points,
-        #                            end.position[None, :]],  # convert to row vectors
-        #                           axis=0)
-        side_shift_vecs = np.array([sideways * length_perp] *
-                                   len(middle_points))
-        asymmetry_vecs = np.array([sideways * asymmetry] * len(middle_points))
-        root_pts = middle_points + asymmetry_vecs
-        top_pts = root_pts + side_shift_vecs
-        bot_pts = root_pts - side_shift_vecs
-
-        ################################################################
-        # Combine points
-        # Meanest part of the meander
-
-        # Add 2 for the lead and end points in the cpw from
-        # pts will have to store properly alternated top_pts and bot_pts
-        # it will also store right-most root_pts (end)
-        # 2 points from top_pts and bot_pts will be dropped for a complete meander
-        pts = np.zeros((len(top_pts) + len(bot_pts) + 1 - 2, 2))
-        # need to add the last root_pts in, because there could be a left-over non-meandered segment
-        pts[-1, :] = root_pts[-1, :]
-        idx_side1_meander, odd = self.get_index_for_side1_meander(len(root_pts))
-        idx_side2_meander = 2 + idx_side1_meander[:None if odd else -2]
-        if first_meander_sideways:
-            pts[idx_side1_meander, :] = top_pts[:-1 if odd else None]
-            pts[idx_side2_meander, :] = bot_pts[1:None if odd else -1]
-        else:
-            pts[idx_side1_meander, :] = bot_pts[:-1 if odd else None]
-            pts[idx_side2_meander, :] = top_pts[1:None if odd else -1]
-
-        pts += start_pt.position  # move to start position
-
-        if snap:
-            if ((mao.dot(start_pt.direction, end_pt.direction) < 0) and
-                (mao.dot(forward, start_pt.direction) <= 0)):
-                # pins are pointing opposite directions and diverging
-                # the last root_pts need to be sideways aligned with the end.position point
-                # and forward aligned with the previous meander point
-                pts[-1, abs(forward[0])] = pts[-2, abs(forward[0])]
-                pts[-1,
-                    abs(forward[0]) - 1] = end_pt.position[abs(forward[0]) - 1]
-            else:
-                # the last root_pts need to be forward aligned with the end.position point
-                pts[-1, abs(forward[0])] = end_pt.position[abs(forward[0])]
-                # and if the last root_pts ends outside the CPW amplitude on the side where the last meander is
-                # then the last meander needs to be locked on it as well
-                if (self.issideways(pts[-1], pts[-3], pts[-2])
-                        and self.issideways(pts[-2], root_pts[0]+start_pt.position, root_pts[-1]+start_pt.position))\
-                        or (not self.issideways(pts[-1], pts[-3], pts[-2])
-                            and not self.issideways(pts[-2], root_pts[0]+start_pt.position,
-                                                    root_pts[-1]+start_pt.position)):
-                    pts[-2, abs(forward[0])] = end_pt.position[abs(forward[0])]
-                    pts[-3, abs(forward[0])] = end_pt.position[abs(forward[0])]
-        if abs(asymmetry) > abs(length_perp):
-            if not ((mao.dot(start_pt.direction, end_pt.direction) < 0) and
-                    (mao.dot(forward, start_pt.direction) <= 0)):
-                # pins are "not" pointing opposite directions and diverging
-                if start_meander_direction * asymmetry < 0:  # sideway direction
-                    pts[0, abs(forward[0])] = start_pt.position[abs(forward[0])]
-                    pts[1, abs(forward[0])] = start_pt.position[abs(forward[0])]
-                if end_meander_direction * asymmetry < 0:  # opposite sideway direction
-                    pts[-2, abs(forward[0])] = end_pt.position[abs(forward[0])]
-                    pts[-3, abs(forward[0])] = end_pt.position[abs(forward[0])]
-
-        # Adjust the meander to eliminate the terminating jog (dogleg)
-        if prevent_short_edges:
-            x2fillet = 2 * self.p.fillet
-            # adjust the tail first
-            # the meander algorithm adds a final point in line with the tail, to cope with left-over
-            # this extra point needs to be moved or not, depending on the tail tip direction
-            if abs(mao.dot(end_pt.direction, sideways)) > 0:
-                skippoint = 0
-            else:
-                skippoint = 1
-            if 0 < abs(mao.round(end_pt.position[0] - pts[-1, 0])) < x2fillet:
-                pts[-1 - skippoint,
-                    0 - skippoint] = end_pt.position[0 - skippoint]
-                pts[-2 - skippoint,
-                    0 - skippoint] = end_pt.position[0 - skippoint]
-            if 0 < abs(mao.round(end_pt.position[1] - pts[-1, 1])) < x2fillet:
-                pts[-1 - skippoint,
-                    1 - skippoint] = end_pt.position[1 - skippoint]
-                pts[-2 - skippoint,
-                    1 - skippoint] = end_pt.position[1 - skippoint]
-            # repeat for the start. here we do not have the extra point
-            if 0 < abs(mao.round(start_pt.position[0] - pts[0, 0])) < x2fillet:
-                pts[0, 0] = start_pt.position[0]
-                pts[1, 0] = start_pt.position[0]
-            if 0 < abs(mao.round(start_pt.position[1] - pts[0, 1])) < x2fillet:
-                pts[0, 1] = start_pt.position[1]
-                pts[1, 1] = start_pt.position[1]
-
-        return pts
-
-    def adjust_length(self, delta_length, pts, start_pt: QRoutePoint,
-                      end_pt: QRoutePoint) -> np.ndarray:
+        return pts, forward, sideways, first_meander_sideways
+
+    def adjust_length(self,
+                      delta_length,
+                      pts,
+                      start_pt: QRoutePoint,
+                      end_pt: QRoutePoint,
+                      forward: np.ndarray = None,
+                      sideways: np.ndarray = None,
+                      first_meander_sideways: bool = None) -> np.ndarray:
         """Edits meander points to redistribute the length slacks accrued with
         the various local adjustments It should be run after
         self.pts_intermediate is completely defined Inputs are however specific
@@ -326,6 +453,12 @@ class RouteMeander(QRoute):
             pts (np.array): intermediate points of meander. pairs, except last point (2,2,...,2,1)
             start_pt (QRoutePoint): QRoutePoint of the start
             end_pt (QRoutePoint): QRoutePoint of the end
+            forward (np.ndarray): Forward unit vector of the meander, as
+                returned by `_connect_meandered`. Defaults to None (recompute).
+            sideways (np.ndarray): Sideways unit vector of the meander, as
+                returned by `_connect_meandered`. Defaults to None (recompute).
+            first_meander_sideways (bool): True if the first meander goes in
+                the sideways direction. Defaults to None (recompute from pts).
 
         Returns:
             np.ndarray: Array of points
@@ -337,37 +470,37 @@ class RouteMeander(QRoute):
             # not a meander
             return pts
 
+        # parsed options
+        fillet = self.p.fillet
+
         # is it an even or odd count of points?
         term_point = len(pts) % 2
 
-        # recompute direction
-        snap = is_true(self.p.snap)  # snap to xy grid
-        forward, sideways = self.get_unit_vectors(start_pt, end_pt, snap)
-        # recompute meander_sideways
-        if mao.cross(pts[1] - pts[0], pts[2] - pts[1]) < 0:
-            first_meander_sideways = True
-        else:
-            first_meander_sideways = False
-        if mao.cross(pts[-2 - term_point] - pts[-1 - term_point],
-                     pts[-3 - term_point] - pts[-2 - term_point]) < 0:
+        if forward is None or sideways is None:
+            # recompute direction
+            snap = is_true(self.p.snap)  # snap to xy grid
+            forward, sideways = self.get_unit_vectors(start_pt, end_pt, snap)
+        if first_meander_sideways is None:
+            # recompute meander_sideways
+            first_meander_sideways = _cross2(pts[1] - pts[0],
+                                             pts[2] - pts[1]) < 0
+        if _cross2(pts[-2 - term_point] - pts[-1 - term_point],
+                   pts[-3 - term_point] - pts[-2 - term_point]) < 0:
             last_meander_sideways = False
         else:
             last_meander_sideways = True
 
         # which points need to receive the shift?
-        # 1. initialize the shift vector to 1 (1 = will receive shift)
-        adjustment_vector = np.ones(len(pts))
-        # 2. switch shift direction depending on sideways or not
-        if first_meander_sideways:
-            adjustment_vector[2::4] *= -1
-            adjustment_vector[3::4] *= -1
-        else:
-            adjustment_vector[::4] *= -1
-            adjustment_vector[1::4] *= -1
+        # 1. initialize the shift vector to +/-1 (non-zero = will receive shift)
+        # 2. the shift direction alternates every pair of points (one meander
+        # curve), with odd pairs flipped if first_meander_sideways, else even pairs
+        flipped_pair = 2 if first_meander_sideways else 0
+        adjustment_vector = np.where((np.arange(len(pts)) & 2) == flipped_pair,
+                                     -1., 1.)
 
         # 3. suppress shift for points that can cause short edges
         # calculate thresholds for suppression of short edges (short edge = not long enough for set fillet)
-        fillet_shift = sideways * self.p.fillet
+        fillet_shift = sideways * fillet
         start_pt_adjusted_up = start_pt.position + fillet_shift
         start_pt_adjusted_down = start_pt.position - fillet_shift
         end_pt_adjusted_up = end_pt.position + fillet_shift
@@ -404,8 +537,8 @@ class RouteMeander(QRoute):
             adjustment_vector[-1] = 0
             # ...unless the last point is anchored to the last meander curve
             if start_pt.direction is not None and end_pt.direction is not None:
-                if ((mao.dot(start_pt.direction, end_pt.direction) < 0) and
-                    (mao.dot(forward, start_pt.direction) <= 0)):
+                if ((_dot2(start_pt.direction, end_pt.direction) < 0) and
+                    (_dot2(forward, start_pt.direction) <= 0)):
                     # pins are pointing opposite directions and diverging, thus keep consistency
                     adjustment_vector[-1] = adjustment_vector[-2]
                     if adjustment_vector[-1]:
@@ -417,10 +550,12 @@ class RouteMeander(QRoute):
         sideways_adjustment = sideways * (
             delta_length /
             (np.count_nonzero(adjustment_vector) - not_a_meander))
-        pts = pts + sideways_adjustment[
-            np.newaxis, :] * adjustment_vector[:, np.newaxis]
+        # shift of each point, then accumulate the points into that same buffer
+        # (the input pts may be a view of the caller's array, leave it intact)
+        shifted_pts = np.outer(adjustment_vector, sideways_adjustment)
+        shifted_pts += pts
 
-        return pts
+        return shifted_pts
 
     @staticmethod
     def get_index_for_side1_meander(num_root_pts: int):
@@ -432,13 +567,7 @@ class RouteMeander(QRoute):
         Returns:
             tuple: Tuple of indices
         """
-        num_2pts, odd = divmod(num_root_pts, 2)
-
-        x = np.array(range(num_2pts), dtype=int) * 4
-        z = np.zeros(num_2pts * 2, dtype=int)
-        z[::2] = x
-        z[1::2] = x + 1
-        return z, odd
+        return _index_for_side1_meander(num_root_pts)
 
     def issideways(self, point, seg_point_a, seg_point_b):
-        return mao.cross(point - seg_point_a, seg_point_b - seg_point_a) < 0
+        return _issideways(point, seg_point_a, seg_point_b)
@@ -19,6 +19,7 @@
 """Qiskit Metal unit tests components functionality."""
 
 import unittest
+from unittest import mock
 import numpy as np
 
 from qiskit_metal.qlibrary.core import _parsed_dynamic_attrs
@@ -27,6 +28,7 @@ from qiskit_metal import draw
 from qiskit_metal.qlibrary._template import MyQComponent
 from qiskit_metal.qlibrary.core import QComponent
 from qiskit_metal.qlibrary.core import QRoute
+from qiskit_metal.qlibrary.core import QRoutePoint
 from qiskit_metal.qlibrary.core import BaseQubit
 from qiskit_metal.qlibrary.lumped.cap_n_interdigital import CapNInterdigital
 from qiskit_metal.qlibrary.couplers.coupled_line_tee import CoupledLineTee
@@ -37,6 +39,7 @@ from qiskit_metal.qlibrary.terminations import short_to_ground
 from qiskit_metal.qlibrary.tlines import anchored_path
 from qiskit_metal.qlibrary.tlines.anchored_path import RouteAnchors
 from qiskit_metal.qlibrary.tlines.framed_path import RouteFramed
+from qiskit_metal.qlibrary.tlines import meandered
 from qiskit_metal.qlibrary.tlines.meandered import RouteMeander
 from qiskit_metal.qlibrary.tlines import straight_path
 from qiskit_metal import designs
@@ -548,6 +551,234 @@ class TestComponentFunctionality(unittest.TestCase, AssertionsMixin):
             anchored_path.intersecting(np.array([1, 1]), np.array([3, 3]),
                                        np.array([5, 5]), np.array([7, 7])))
 
+    def test_qlibrary_meander_snap(self):
+        """Test connect_meandered core in meandered.py with snap, for an odd
+        and an even number of meanders."""
+        route = dict(start_pos=np.array([0., 0.]),
+                     start_dir=np.array([0., 1.]),
+                     end_pos=np.array([1., 0.]),
+                     forward=np.array([1, 0]),
+                     sideways=np.array([0., 1.]),
+                     spacing=0.2,
+                     asymmetry=0.,
+                     length_meander=2.,
+                     snap=True,
+                     prevent_short_edges=True,
+                     fillet=0.05)
+
+        pts, first_meander_sideways = meandered._connect_meandered_kernel(
+            end_dir=np.array([0., 1.]), **route)
+        expected = np.array([[0., 0.1], [0.2, 0.1], [0.2, -0.1], [0.4, -0.1],
+                             [0.4, 0.1], [0.6, 0.1], [0.6, -0.1], [0.8, -0.1],
+                             [0.8, 0.1], [1., 0.1], [1., 0.]])
+        self.assertEqual(pts.shape, expected.shape)
+        self.assertIterableAlmostEqual(expected.ravel(),
+                                       pts.ravel(),
+                                       abs_tol=1e-9)
+        self.assertTrue(first_meander_sideways)
+
+        pts, first_meander_sideways = meandered._connect_meandered_kernel(
+            end_dir=np.array([0., -1.]), **route)
+        expected = np.array([[0., 0.125], [0.2, 0.125], [0.2, -0.125],
+                             [0.4, -0.125], [0.4, 0.125], [0.6, 0.125],
+                             [0.6, -0.125], [0.8, -0.125], [1., -0.125]])
+        self.assertEqual(pts.shape, expected.shape)
+        self.assertIterableAlmostEqual(expected.ravel(),
+                                       pts.ravel(),
+                                       abs_tol=1e-9)
+        self.assertTrue(first_meander_sideways)
+
+    def test_qlibrary_meander_no_snap(self):
+        """Test connect_meandered core in meandered.py without snap, for an
+        odd and an even number of meanders."""
+        route = dict(start_pos=np.array([0., 0.]),
+                     start_dir=np.array([0., 1.]),
+                     end_pos=np.array([0.8, 0.6]),
+                     forward=np.array([0.8, 0.6]),
+                     sideways=np.array([-0.6, 0.8]),
+                     spacing=0.2,
+                     asymmetry=0.,
+                     length_meander=2.,
+                     snap=False,
+                     prevent_short_edges=True,
+                     fillet=0.05)
+
+        pts, first_meander_sideways = meandered._connect_meandered_kernel(
+            end_dir=np.array([0., 1.]), **route)
+        expected = np.array([[0., 0.], [0., 0.], [0.22, 0.04], [0.38, 0.16],
+                             [0.26, 0.32], [0.42, 0.44], [0.54,
+                                                          0.28], [0.7, 0.4],
+                             [0.58, 0.56], [0.74, 0.68], [0.8, 0.6]])
+        self.assertEqual(pts.shape, expected.shape)
+        self.assertIterableAlmostEqual(expected.ravel(),
+                                       pts.ravel(),
+                                       abs_tol=1e-9)
+        self.assertTrue(first_meander_sideways)
+
+        pts, first_meander_sideways = meandered._connect_meandered_kernel(
+            end_dir=np.array([0., -1.]), **route)
+        expected = np.array([[0., 0.1], [0., 0.22], [0.235, 0.02],
+                             [0.395, 0.14], [0.245, 0.34], [0.405, 0.46],
+                             [0.555, 0.26], [0.715, 0.38], [0.64, 0.48]])
+        self.assertEqual(pts.shape, expected.shape)
+        self.assertIterableAlmostEqual(expected.ravel(),
+                                       pts.ravel(),
+                                       abs_tol=1e-9)
+        self.assertTrue(first_meander_sideways)
+
+    def test_qlibrary_meander_zero_meanders(self):
+        """Test connect_meandered core in meandered.py when the pins are closer
+        than the meander spacing."""
+        pts, first_meander_sideways = meandered._connect_meandered_kernel(
+            start_pos=np.array([0., 0.]),
+            start_dir=np.array([1., 0.]),
+            end_pos=np.array([0.1, 0.]),
+            end_dir=np.array([-1., 0.]),
+            forward=np.array([1, 0]),
+            sideways=np.array([0., 1.]),
+            spacing=0.2,
+            asymmetry=0.,
+            length_meander=1.,
+            snap=True,
+            prevent_short_edges=True,
+            fillet=0.)
+        self.assertEqual(pts.shape, (0, 2))
+        self.assertTrue(first_meander_sideways)
+
+    def test_qlibrary_meander_make_zero_meanders(self):
+        """Test make in meandered.py skips the length adjustment when no
+        meander fits."""
+        route = RouteMeander.__new__(RouteMeander)
+        route.p = Dict(total_length=1.)
+        route.head = Dict(length=0.)
+        route.tail = Dict(length=0.)
+        route.set_pin = mock.Mock()
+        route.set_lead = mock.Mock()
+        route.get_points = mock.Mock(
+            return_value=np.array([[0., 0.], [0.1, 0.]]))
+        route.make_elements = mock.Mock()
+        route.adjust_length = mock.Mock()
+        forward = np.array([1, 0])
+        sideways = np.array([0., 1.])
+        no_meander = (np.empty((0, 2)), forward, sideways, True)
+        route._connect_meandered = mock.Mock(return_value=no_meander)
+
+        route.make()
+        route.adjust_length.assert_not_called()
+        route.make_elements.assert_called_once()
+        self.assertEqual(route.intermediate_pts.shape, (0, 2))
+
+    def test_qlibrary_meander_parity_zero_meanders(self):
+        """Test connect_meandered core in meandered.py when the root
+        orientations leave no meander."""
+        # one meander fits, but opposite roots need an even number of them
+        pts, first_meander_sideways = meandered._connect_meandered_kernel(
+            start_pos=np.array([0., 0.]),
+            start_dir=np.array([0., 1.]),
+            end_pos=np.array([0.3, 0.]),
+            end_dir=np.array([0., -1.]),
+            forward=np.array([1, 0]),
+            sideways=np.array([0., 1.]),
+            spacing=0.2,
+            asymmetry=0.,
+            length_meander=1.,
+            snap=True,
+            prevent_short_edges=True,
+            fillet=0.)
+        self.assertEqual(pts.shape, (0, 2))
+        self.assertTrue(first_meander_sideways)
+
+    def test_qlibrary_meander_short_edge_boundary(self):
+        """Test connect_meandered core in meandered.py keeps an end jog of
+        exactly twice the fillet."""
+        # the gap to the end x is 0.1 up to float noise, thus not a short edge
+        pts, _ = meandered._connect_meandered_kernel(
+            start_pos=np.array([0.25, 1.22]),
+            start_dir=np.array([-1., 0.]),
+            end_pos=np.array([-0.35, 1.52]),
+            end_dir=np.array([0., -1.]),
+            forward=np.array([-1, 0]),
+            sideways=np.array([0., -1.]),
+            spacing=0.25,
+            asymmetry=-0.3,
+            length_meander=2.,
+            snap=True,
+            prevent_short_edges=True,
+            fillet=0.05)
+        expected = np.array([[0.25, 1.72], [0., 1.72], [0., 1.52],
+                             [-0.25, 1.52], [-0.25, 1.52]])
+        self.assertEqual(pts.shape, expected.shape)
+        self.assertIterableAlmostEqual(expected.ravel(),
+                                       pts.ravel(),
+                                       abs_tol=1e-9)
+
+    def test_qlibrary_meander_asymmetry_no_snap(self):
+        """Test connect_meandered core in meandered.py aligns the roots to the
+        pins when the asymmetry exceeds the meander width, without snap."""
+        pts, _ = meandered._connect_meandered_kernel(
+            start_pos=np.array([0., 0.]),
+            start_dir=np.array([0., 1.]),
+            end_pos=np.array([0.8, 0.6]),
+            end_dir=np.array([0., 1.]),
+            forward=np.array([0.8, 0.6]),
+            sideways=np.array([-0.6, 0.8]),
+            spacing=0.2,
+            asymmetry=-0.3,
+            length_meander=1.2,
+            snap=False,
+            prevent_short_edges=False,
+            fillet=0.)
+        self.assertEqual(pts.shape, (11, 2))
+        self.assertIterableAlmostEqual([0., 0.], pts[:2, 1], abs_tol=1e-9)
+        self.assertIterableAlmostEqual([0.6, 0.6], pts[-3:-1, 1], abs_tol=1e-9)
+
+    def test_qlibrary_meander_adjust_length_first_meander_sideways(self):
+        """Test adjust_length in meandered.py follows the first_meander_sideways
+        of the core, when the asymmetry alignment flattens the first curve."""
+        start = QRoutePoint(np.array([0., 0.]), np.array([0., -1.]))
+        end = QRoutePoint(np.array([0.1, -1.1]), np.array([0., -1.]))
+        forward = np.array([0, -1])
+        sideways = np.array([1., 0.])
+        pts, first_meander_sideways = meandered._connect_meandered_kernel(
+            start_pos=start.position,
+            start_dir=start.direction,
+            end_pos=end.position,
+            end_dir=end.direction,
+            forward=forward,
+            sideways=sideways,
+            spacing=0.35,
+            asymmetry=-0.1,
+            length_meander=1.,
+            snap=True,
+            prevent_short_edges=True,
+            fillet=0.05)
+        # the first two points are aligned to the asymmetry: no curve to read
+        self.assertEqual(pts[0, 0], pts[2, 0])
+        self.assertTrue(first_meander_sideways)
+
+        route = RouteMeander.__new__(RouteMeander)
+        route.p = Dict(fillet=0.05)
+        shifted = route.adjust_length(
+            0.37,
+            pts,
+            start,
+            end,
+            forward=forward,
+            sideways=sideways,
+            first_meander_sideways=first_meander_sideways)
+        self.assertEqual(
+            np.sign(shifted - pts)[:, 0].tolist(), [0, 0, -1, -1, 0, 0, 0])
+
+        # without the flag, it is guessed from the flattened first curve
+        shifted = route.adjust_length(0.37,
+                                      pts,
+                                      start,
+                                      end,
+                                      forward=forward,
+                                      sideways=sideways)
+        self.assertEqual(
+            np.sign(shifted - pts)[:, 0].tolist(), [-1, -1, 1, 1, 0, 0, 0])
+
     @staticmethod
     def generate_spiral_list(x: int, y: int):
         """Helper function to generate a sprital list.